@@ -10,10 +10,18 @@ Database Note: Currently using SQLite for simplicity. To swap to Postgres (Rende
 """
 
 import os
+import re
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from types import MappingProxyType
+import orjson
+from flask import Flask, g, has_request_context, make_response, render_template, request, redirect, url_for
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from flask_caching import Cache
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy import delete, event, false, func, insert, lambda_stmt, select, tuple_, update
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -34,14 +42,114 @@ if DATABASE_URL.startswith('postgres://'):
 
 app.config['SQLALCHEMY_DATABASE_URI'] = DATABASE_URL
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+# Connection pool for Postgres under gunicorn (one pool per worker).
+# pre_ping drops stale connections, LIFO keeps a small set of connections warm.
+if DATABASE_URL.startswith('postgresql'):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': 5,
+        'max_overflow': 5,
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+        'pool_use_lifo': True,
+        'connect_args': {'keepalives': 1, 'keepalives_idle': 30}
+    }
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-key-change-in-production')
 
+# ============== CACHE CONFIGURATION ==============
+# For local dev: in-process cache (per worker)
+# For Render: Set REDIS_URL so all gunicorn workers share one cache
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    app.config['CACHE_TYPE'] = 'RedisCache'
+    app.config['CACHE_REDIS_URL'] = REDIS_URL
+else:
+    app.config['CACHE_TYPE'] = 'SimpleCache'
+app.config['CACHE_DEFAULT_TIMEOUT'] = 30
+
+# In production (Render), Flask runs via Gunicorn with debug=False
+IS_PRODUCTION = os.getenv('FLASK_ENV') == 'production' or os.getenv('RENDER') == 'true'
+
 # Initialize extensions
 db = SQLAlchemy(app)
 migrate = Migrate(app, db)
+cache = Cache(app)
+
+# ============== PLATFORM CONFIGURATION ==============
+PLATFORMS = {
+    'tiktok': {'name': 'TikTok', 'color': '#000000'},
+    'youtube': {'name': 'YouTube', 'color': '#FF0000'},
+    'instagram': {'name': 'Instagram', 'color': '#E1306C'},
+    'facebook': {'name': 'Facebook', 'color': '#1877F2'},
+    'linkedin': {'name': 'LinkedIn', 'color': '#0A66C2'},
+    'threads': {'name': 'Threads', 'color': '#333333'}
+}
+
+# Mocked analytics (placeholder until real API calls are wired in)
+_MOCK_FOLLOWERS = {
+    'tiktok': 15000,
+    'youtube': 8500,
+    'instagram': 12000,
+    'facebook': 5000,
+    'linkedin': 3200,
+    'threads': 2100
+}
+_MOCK_VIEWS = {
+    'tiktok': 125000,
+    'youtube': 45000,
+    'instagram': 38000,
+    'facebook': 12000,
+    'linkedin': 5600,
+    'threads': 8900
+}
+# Built once and shared by every platform: read-only, so callers can't mutate it
+_MOCK_TOP_POSTS = tuple(
+    # Real API would fetch actual top posts
+    MappingProxyType({
+        'title': f'Top post #{i+1}',
+        'engagement': engagement,
+        'date': '2024-01-20'
+    }) for i, engagement in enumerate((450, 380, 290))
+)
 
 # ============== DATABASE MODELS ==============
 
+class utcnow(FunctionElement):
+    """
+    Current UTC time as a naive timestamp with sub-second precision, evaluated by the DB.
+    Naive to match scheduled_datetime; SQLite's CURRENT_TIMESTAMP only has whole seconds.
+    Dialects without an override below fall back to CURRENT_TIMESTAMP (server time).
+    """
+    type = db.DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return 'CURRENT_TIMESTAMP'
+
+
+@compiles(utcnow, 'postgresql')
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, 'mssql')
+def _utcnow_mssql(element, compiler, **kw):
+    # [MS365_INTEGRATION] Azure SQL
+    return 'GETUTCDATE()'
+
+
+@compiles(utcnow, 'mysql')
+def _utcnow_mysql(element, compiler, **kw):
+    return 'UTC_TIMESTAMP(6)'
+
+
+@compiles(utcnow, 'sqlite')
+def _utcnow_sqlite(element, compiler, **kw):
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
 class ScheduledPost(db.Model):
     """
     Model for scheduled social media posts.
@@ -49,6 +157,11 @@ class ScheduledPost(db.Model):
     [MS365_INTEGRATION] Future: Could add OneNote or SharePoint sync via Graph API.
     """
     __tablename__ = 'scheduled_posts'
+    # Every hot read filters on is_posted=False, then sorts by datetime or groups by platform
+    __table_args__ = (
+        db.Index('ix_sp_unposted_sched', 'is_posted', 'scheduled_datetime', 'id'),
+        db.Index('ix_sp_unposted_platform', 'is_posted', 'platform'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     platform = db.Column(
@@ -58,29 +171,90 @@ class ScheduledPost(db.Model):
         comment="Platform: tiktok, youtube, instagram, facebook, linkedin, threads"
     )
     caption = db.Column(db.Text, nullable=False, comment="Post caption/description")
-    scheduled_datetime = db.Column(db.DateTime, nullable=False, index=True, comment="When to post")
+    scheduled_datetime = db.Column(db.DateTime, nullable=False, comment="When to post")
     link_or_asset_note = db.Column(db.Text, nullable=True, comment="Optional link or file reference")
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, comment="Creation timestamp")
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Timestamps are generated by the database, not in Python, on INSERT/UPDATE
+    created_at = db.Column(db.DateTime, server_default=utcnow(), comment="Creation timestamp")
+    updated_at = db.Column(db.DateTime, server_default=utcnow(), onupdate=utcnow())
     is_posted = db.Column(db.Boolean, default=False, comment="True if successfully posted")
 
-    def to_dict(self):
-        """Convert model to dict for JSON responses."""
+    @staticmethod
+    def row_to_dict(row):
+        """Convert a model instance or a column-projected row to a dict."""
         return {
-            'id': self.id,
-            'platform': self.platform,
-            'caption': self.caption,
-            'scheduled_datetime': self.scheduled_datetime.isoformat(),
-            'link_or_asset_note': self.link_or_asset_note,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'is_posted': self.is_posted
+            'id': row.id,
+            'platform': row.platform,
+            'caption': row.caption,
+            'scheduled_datetime': row.scheduled_datetime,
+            'link_or_asset_note': row.link_or_asset_note,
+            'created_at': row.created_at,
+            'updated_at': row.updated_at,
+            'is_posted': row.is_posted
         }
 
     def __repr__(self):
         return f'<ScheduledPost {self.id} {self.platform} {self.scheduled_datetime}>'
 
 
+# Columns for read-only list queries (skips building full ORM instances)
+POST_COLUMNS = (
+    ScheduledPost.id,
+    ScheduledPost.platform,
+    ScheduledPost.caption,
+    ScheduledPost.scheduled_datetime,
+    ScheduledPost.link_or_asset_note,
+    ScheduledPost.created_at,
+    ScheduledPost.updated_at,
+    ScheduledPost.is_posted
+)
+
+# Hot queries, compiled once and reused (see get_unposted_page / get_analytics_data)
+UNPOSTED_STMT = lambda_stmt(
+    lambda: select(*POST_COLUMNS).where(ScheduledPost.is_posted == false())
+)
+COUNT_BY_PLATFORM_STMT = lambda_stmt(
+    lambda: select(ScheduledPost.platform, func.count(ScheduledPost.id))
+    .where(ScheduledPost.is_posted == false())
+    .group_by(ScheduledPost.platform)
+)
+
+
+# ============== PAGINATION ==============
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def get_unposted_page():
+    """
+    Fetch one page of unposted posts (as POST_COLUMNS rows), ordered by scheduled time.
+    Keyset pagination via ?limit=50&cursor=<iso_datetime>&cursor_id=<id>, where
+    cursor/cursor_id are the scheduled_datetime/id of the last row already seen.
+    Served by the (is_posted, scheduled_datetime, id) index regardless of table size.
+    Raises ValueError if the cursor is not a valid ISO datetime.
+    """
+    limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+
+    # lambda_stmt caches the compiled SQL per code path; each request only binds params
+    stmt = UNPOSTED_STMT
+    cursor = request.args.get('cursor')
+    if cursor:
+        cursor_dt = datetime.fromisoformat(cursor)
+        cursor_id = request.args.get('cursor_id', type=int)
+        if cursor_id is None:
+            stmt += lambda s: s.where(ScheduledPost.scheduled_datetime > cursor_dt)
+        else:
+            # Row-value comparison: tie-breaks on id so posts sharing a timestamp are
+            # not skipped, while staying a single index range scan
+            stmt += lambda s: s.where(
+                tuple_(ScheduledPost.scheduled_datetime, ScheduledPost.id) > tuple_(cursor_dt, cursor_id)
+            )
+    stmt += lambda s: s.order_by(ScheduledPost.scheduled_datetime, ScheduledPost.id).limit(limit)
+
+    rows = db.session.execute(stmt).all()
+    return rows, limit
+
+
 # ============== ANALYTICS DATA (PLACEHOLDER) ==============
 def get_analytics_data():
     """
@@ -96,14 +270,8 @@ def get_analytics_data():
     Currently returns mocked data for UI development and testing.
     Each platform API should cache results to avoid rate limits.
     """
-    PLATFORMS = {
-        'tiktok': {'name': 'TikTok', 'color': '#000000'},
-        'youtube': {'name': 'YouTube', 'color': '#FF0000'},
-        'instagram': {'name': 'Instagram', 'color': '#E1306C'},
-        'facebook': {'name': 'Facebook', 'color': '#1877F2'},
-        'linkedin': {'name': 'LinkedIn', 'color': '#0A66C2'},
-        'threads': {'name': 'Threads', 'color': '#333333'}
-    }
+    # One GROUP BY query instead of a COUNT per platform
+    scheduled_counts = dict(db.session.execute(COUNT_BY_PLATFORM_STMT).all())
 
     analytics = {}
     for platform_key, platform_info in PLATFORMS.items():
@@ -111,160 +279,329 @@ def get_analytics_data():
         analytics[platform_key] = {
             'name': platform_info['name'],
             'color': platform_info['color'],
-            'followers': {
-                'tiktok': 15000,
-                'youtube': 8500,
-                'instagram': 12000,
-                'facebook': 5000,
-                'linkedin': 3200,
-                'threads': 2100
-            }.get(platform_key, 0),
-            'views_7d': {
-                'tiktok': 125000,
-                'youtube': 45000,
-                'instagram': 38000,
-                'facebook': 12000,
-                'linkedin': 5600,
-                'threads': 8900
-            }.get(platform_key, 0),
-            'posts_scheduled': ScheduledPost.query.filter_by(platform=platform_key, is_posted=False).count(),
-            'top_posts': [
-                # Real API would fetch actual top posts
-                {
-                    'title': f'Top post #{i+1}',
-                    'engagement': [450, 380, 290, 210, 150][i],
-                    'date': '2024-01-20'
-                } for i in range(3)
-            ]
+            'followers': _MOCK_FOLLOWERS.get(platform_key, 0),
+            'views_7d': _MOCK_VIEWS.get(platform_key, 0),
+            'posts_scheduled': scheduled_counts.get(platform_key, 0),
+            'top_posts': _MOCK_TOP_POSTS
         }
     return analytics
 
 
+# ============== ANALYTICS CACHE ==============
+# A cache outage (e.g. Redis down) must never fail a request: reads fall back to
+# recomputing, and writes have already committed by the time they invalidate.
+ANALYTICS_CACHE_KEY = 'analytics'
+
+
+def get_cached_analytics():
+    """Return the cached analytics page, or None on a miss or cache error."""
+    try:
+        return cache.get(ANALYTICS_CACHE_KEY)
+    except Exception:
+        app.logger.exception('Analytics cache read failed')
+        return None
+
+
+def set_cached_analytics(html):
+    """Cache the rendered analytics page for 30s, ignoring cache errors."""
+    try:
+        cache.set(ANALYTICS_CACHE_KEY, html, timeout=30)
+    except Exception:
+        app.logger.exception('Analytics cache write failed')
+
+
+def invalidate_analytics():
+    """Drop the cached analytics page after a write, ignoring cache errors."""
+    try:
+        cache.delete(ANALYTICS_CACHE_KEY)
+    except Exception:
+        app.logger.exception('Analytics cache invalidation failed')
+
+
+# ============== JSON RESPONSES ==============
+def ojsonify(obj):
+    """
+    Serialize to a JSON response with orjson (handles datetime natively).
+    Like jsonify, set a non-200 status by returning a (response, code) tuple.
+    """
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+
 # ============== ROUTES ==============
 
 @app.route('/')
 def index():
-    """Home page - redirects to scheduler."""
-    return redirect(url_for('scheduler'))
+    """Home page - permanently redirects to scheduler (cacheable by browsers/CDN)."""
+    response = redirect(SCHEDULER_URL, code=308)
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
 
 
 @app.route('/scheduler')
 def scheduler():
-    """Scheduler page - view and manage scheduled posts."""
-    scheduled_posts = ScheduledPost.query.filter_by(is_posted=False).order_by(
-        ScheduledPost.scheduled_datetime
-    ).all()
-    
-    # Platform color mapping
-    platform_colors = {
-        'tiktok': '#000000',
-        'youtube': '#FF0000',
-        'instagram': '#E1306C',
-        'facebook': '#1877F2',
-        'linkedin': '#0A66C2',
-        'threads': '#333333'
-    }
-    
-    return render_template(
-        'scheduler.html',
-        posts=scheduled_posts,
-        platform_colors=platform_colors,
-        platforms=['tiktok', 'youtube', 'instagram', 'facebook', 'linkedin', 'threads']
-    )
+    """
+    Scheduler page - view and manage scheduled posts.
+    The list and calendar are rendered client-side from /api/posts, so no query runs here.
+    """
+    return render_template('scheduler.html')
 
 
 @app.route('/analytics')
 def analytics():
-    """Analytics dashboard page."""
-    analytics_data = get_analytics_data()
-    return render_template('analytics.html', analytics=analytics_data)
+    """Analytics dashboard page (cached for 30s, served conditionally via ETag)."""
+    html = get_cached_analytics()
+    if html is None:
+        analytics_data = get_analytics_data()
+        html = render_template('analytics.html', analytics=analytics_data)
+        set_cached_analytics(html)
+
+    response = make_response(html)
+    response.add_etag()
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+# Resolved once at import so index() doesn't walk the URL map per request
+with app.test_request_context():
+    SCHEDULER_URL = url_for('scheduler')
 
 
 # ============== API ENDPOINTS (for AJAX requests) ==============
 
 @app.route('/api/posts', methods=['GET'])
 def get_posts():
-    """Fetch all unposted scheduled posts as JSON."""
-    posts = ScheduledPost.query.filter_by(is_posted=False).order_by(
-        ScheduledPost.scheduled_datetime
-    ).all()
-    return jsonify([post.to_dict() for post in posts])
+    """
+    Fetch a page of unposted scheduled posts as JSON.
+    When more posts remain, the X-Next-Cursor / X-Next-Cursor-Id headers hold
+    the cursor/cursor_id query params for the next page.
+    The ETag is a hash of the serialized page, so an unchanged page answers
+    If-None-Match with an empty 304 and any write to it changes the tag.
+    """
+    try:
+        rows, limit = get_unposted_page()
+    except ValueError:
+        return ojsonify({'error': 'Invalid cursor. Use ISO format: YYYY-MM-DDTHH:mm'}), 400
+
+    response = ojsonify([ScheduledPost.row_to_dict(row) for row in rows])
+    if len(rows) == limit:
+        last = rows[-1]
+        response.headers['X-Next-Cursor'] = last.scheduled_datetime.isoformat()
+        response.headers['X-Next-Cursor-Id'] = str(last.id)
+    response.add_etag()
+    # Always revalidate: the page reloads the list right after each write
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+# Schedule datetimes as sent by the form's datetime-local input: YYYY-MM-DDTHH:MM[:SS]
+_ISO_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})T([0-9]{2}):([0-9]{2})(?::([0-9]{2}))?')
+
+
+def parse_sched(value):
+    """
+    Parse a schedule datetime string (fast path for the one format the UI sends).
+    Raises ValueError on anything else, including out-of-range fields.
+    """
+    match = _ISO_RE.fullmatch(value) if isinstance(value, str) else None
+    if not match:
+        raise ValueError(f'Invalid schedule datetime: {value!r}')
+    year, month, day, hour, minute, second = match.groups(default='0')
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+
+
+MAX_BULK_POSTS = 200
+
+
+def parse_post_fields(data):
+    """
+    Validate a create-post payload and return the column values to insert.
+    Raises ValueError with a client-facing message on invalid input.
+    """
+    # Validate required fields
+    if not isinstance(data, dict) or not all(k in data for k in ['platform', 'caption', 'scheduled_datetime']):
+        raise ValueError('Missing required fields')
+
+    # Parse datetime
+    try:
+        scheduled_dt = parse_sched(data['scheduled_datetime'])
+    except ValueError:
+        raise ValueError('Invalid datetime format. Use ISO format: YYYY-MM-DDTHH:mm')
+
+    return {
+        'platform': data['platform'].lower(),
+        'caption': data['caption'],
+        'scheduled_datetime': scheduled_dt,
+        'link_or_asset_note': data.get('link_or_asset_note', '')
+    }
 
 
 @app.route('/api/posts', methods=['POST'])
 def create_post():
-    """Create a new scheduled post."""
+    """
+    Create a new scheduled post.
+    Also accepts a JSON list of posts, inserted in one batch and one commit.
+    """
     try:
         data = request.get_json()
-        
-        # Validate required fields
-        if not all(k in data for k in ['platform', 'caption', 'scheduled_datetime']):
-            return jsonify({'error': 'Missing required fields'}), 400
-        
-        # Parse datetime
+
+        if isinstance(data, list):
+            return create_posts_bulk(data)
+
         try:
-            scheduled_dt = datetime.fromisoformat(data['scheduled_datetime'])
-        except ValueError:
-            return jsonify({'error': 'Invalid datetime format. Use ISO format: YYYY-MM-DDTHH:mm'}), 400
+            values = parse_post_fields(data)
+        except ValueError as e:
+            return ojsonify({'error': str(e)}), 400
         
-        # Create post
-        post = ScheduledPost(
-            platform=data['platform'].lower(),
-            caption=data['caption'],
-            scheduled_datetime=scheduled_dt,
-            link_or_asset_note=data.get('link_or_asset_note', '')
-        )
-        
-        db.session.add(post)
+        # Create post with a single INSERT ... RETURNING (no ORM instance or flush)
+        row = db.session.execute(
+            insert(ScheduledPost).values(**values).returning(
+                ScheduledPost.id, ScheduledPost.created_at, ScheduledPost.updated_at, ScheduledPost.is_posted
+            )
+        ).one()
         db.session.commit()
+        invalidate_analytics()
         
-        return jsonify(post.to_dict()), 201
+        return ojsonify({
+            'id': row.id,
+            **values,
+            'created_at': row.created_at,
+            'updated_at': row.updated_at,
+            'is_posted': row.is_posted
+        }), 201
     
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
+
+
+def create_posts_bulk(items):
+    """Validate every post up front, then insert them all in a single statement."""
+    if not items:
+        return ojsonify({'error': 'No posts provided'}), 400
+    if len(items) > MAX_BULK_POSTS:
+        return ojsonify({'error': f'Too many posts (max {MAX_BULK_POSTS} per request)'}), 400
+
+    rows = []
+    for i, item in enumerate(items):
+        try:
+            rows.append(parse_post_fields(item))
+        except ValueError as e:
+            return ojsonify({'error': f'Post {i}: {e}'}), 400
+
+    # Multi-row INSERT ... RETURNING (batched by SQLAlchemy's insertmanyvalues).
+    # Postgres batches with sort_by_parameter_order, which guarantees input order.
+    # SQLite can't (it would fall back to one INSERT per row), so there we rely on
+    # ids being assigned in VALUES order and sort by id instead.
+    ordered = db.session.get_bind().dialect.name == 'postgresql'
+    created = db.session.execute(
+        insert(ScheduledPost).returning(*POST_COLUMNS, sort_by_parameter_order=ordered),
+        rows
+    ).all()
+    db.session.commit()
+    invalidate_analytics()
+
+    if not ordered:
+        created.sort(key=lambda row: row.id)
+    return ojsonify([ScheduledPost.row_to_dict(row) for row in created]), 201
 
 
 @app.route('/api/posts/<int:post_id>', methods=['PUT'])
 def update_post(post_id):
-    """Update a scheduled post."""
+    """Update a scheduled post with a single UPDATE ... RETURNING."""
     try:
-        post = ScheduledPost.query.get_or_404(post_id)
         data = request.get_json()
         
         # Update fields if provided
+        values = {}
         if 'platform' in data:
-            post.platform = data['platform'].lower()
+            values['platform'] = data['platform'].lower()
         if 'caption' in data:
-            post.caption = data['caption']
+            values['caption'] = data['caption']
         if 'scheduled_datetime' in data:
             try:
-                post.scheduled_datetime = datetime.fromisoformat(data['scheduled_datetime'])
+                values['scheduled_datetime'] = parse_sched(data['scheduled_datetime'])
             except ValueError:
-                return jsonify({'error': 'Invalid datetime format'}), 400
+                return ojsonify({'error': 'Invalid datetime format'}), 400
         if 'link_or_asset_note' in data:
-            post.link_or_asset_note = data['link_or_asset_note']
+            values['link_or_asset_note'] = data['link_or_asset_note']
+        
+        if values:
+            row = db.session.execute(
+                update(ScheduledPost)
+                .where(ScheduledPost.id == post_id)
+                .values(**values)
+                .returning(*POST_COLUMNS)
+                .execution_options(synchronize_session=False)
+            ).one_or_none()
+        else:
+            row = db.session.execute(
+                select(*POST_COLUMNS).where(ScheduledPost.id == post_id)
+            ).one_or_none()
+        if row is None:
+            db.session.rollback()
+            return ojsonify({'error': 'Post not found'}), 404
         
         db.session.commit()
-        return jsonify(post.to_dict())
+        invalidate_analytics()
+        return ojsonify(ScheduledPost.row_to_dict(row))
     
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 
 @app.route('/api/posts/<int:post_id>', methods=['DELETE'])
 def delete_post(post_id):
-    """Delete a scheduled post."""
+    """Delete a scheduled post with a single DELETE (no SELECT first)."""
     try:
-        post = ScheduledPost.query.get_or_404(post_id)
-        db.session.delete(post)
+        result = db.session.execute(
+            delete(ScheduledPost)
+            .where(ScheduledPost.id == post_id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.session.rollback()
+            return ojsonify({'error': 'Post not found'}), 404
+        
         db.session.commit()
-        return jsonify({'message': 'Post deleted'}), 200
+        invalidate_analytics()
+        return ojsonify({'message': 'Post deleted'}), 200
     
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
+
+
+# ============== N+1 QUERY CANARY (DEV ONLY) ==============
+# Every list endpoint should run a fixed, small number of queries. If a request
+# issues more, a relationship is probably being lazy-loaded per row: load it with
+# selectinload()/joinedload() on the list query instead.
+QUERY_COUNT_WARN_THRESHOLD = 3
+
+if not IS_PRODUCTION:
+    @event.listens_for(Engine, 'before_cursor_execute')
+    def count_request_queries(conn, cursor, statement, parameters, context, executemany):
+        """Count read queries issued within the current request (writes can't be N+1 loads)."""
+        if context is not None and (context.isinsert or context.isupdate or context.isdelete):
+            return
+        if has_request_context():
+            g.query_count = g.get('query_count', 0) + 1
+
+    @app.before_request
+    def reset_query_count():
+        """Start each request at zero (g lives on the app context, which can span requests)."""
+        g.query_count = 0
+
+    @app.after_request
+    def warn_on_query_burst(response):
+        """Log requests whose read-query count suggests an N+1 pattern."""
+        query_count = g.get('query_count', 0)
+        if query_count > QUERY_COUNT_WARN_THRESHOLD:
+            app.logger.warning(
+                'Possible N+1: %s %s issued %d queries', request.method, request.path, query_count
+            )
+        return response
 
 
 # ============== ERROR HANDLERS ==============
@@ -284,10 +621,11 @@ def server_error(error):
 # ============== DEVELOPMENT ==============
 
 if __name__ == '__main__':
-    with app.app_context():
-        db.create_all()
+    # Opt-in table creation for quick local runs; otherwise rely on `flask db upgrade`
+    # (create_all() reflects every table on startup, which slows cold starts)
+    if os.getenv('AUTO_CREATE_TABLES') == '1':
+        with app.app_context():
+            db.create_all()
     
-    # In production (Render), Flask runs via Gunicorn with debug=False
     # This is only for local development
-    is_production = os.getenv('FLASK_ENV') == 'production' or os.getenv('RENDER') == 'true'
-    app.run(debug=not is_production, host='0.0.0.0', port=int(os.getenv('PORT', 5000)))
+    app.run(debug=not IS_PRODUCTION, host='0.0.0.0', port=int(os.getenv('PORT', 5000)))
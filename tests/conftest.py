@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+# Use a throwaway in-memory database; must be set before app.py is imported
+os.environ['DATABASE_URL'] = 'sqlite://'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app as flask_app, cache, db  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    """App context backed by a fresh, empty schema."""
+    with flask_app.app_context():
+        db.create_all()
+        cache.clear()
+        yield flask_app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    """Test client for the app fixture."""
+    return app.test_client()
@@ -0,0 +1,150 @@
+from datetime import datetime
+
+import pytest
+from flask import g
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import mssql, mysql, postgresql, sqlite
+
+from app import MAX_BULK_POSTS, ScheduledPost, cache, db, parse_sched, utcnow
+
+
+def create_post(client, **overrides):
+    data = {'platform': 'tiktok', 'caption': 'hello', 'scheduled_datetime': '2026-01-02T10:00'}
+    data.update(overrides)
+    response = client.post('/api/posts', json=data)
+    assert response.status_code == 201
+    return response.get_json()
+
+
+def test_get_posts_returns_304_for_unchanged_page(client):
+    create_post(client)
+    etag = client.get('/api/posts').headers['ETag']
+
+    response = client.get('/api/posts', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+
+def test_get_posts_etag_changes_after_edit(client):
+    post = create_post(client)
+    etag = client.get('/api/posts').headers['ETag']
+
+    # Same second as the GET above: the old ETag must not be served a 304
+    client.put(f"/api/posts/{post['id']}", json={'caption': 'edited'})
+    response = client.get('/api/posts', headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.get_json()[0]['caption'] == 'edited'
+    assert response.headers['ETag'] != etag
+
+
+def test_bulk_create_returns_posts_in_input_order(client):
+    payload = [
+        {'platform': 'youtube', 'caption': f'post {i}', 'scheduled_datetime': f'2026-01-0{i + 1}T10:00'}
+        for i in range(4)
+    ]
+    response = client.post('/api/posts', json=payload)
+
+    assert response.status_code == 201
+    assert [post['caption'] for post in response.get_json()] == [item['caption'] for item in payload]
+
+
+def test_bulk_create_rejects_invalid_item(client):
+    payload = [
+        {'platform': 'youtube', 'caption': 'ok', 'scheduled_datetime': '2026-01-01T10:00'},
+        {'platform': 'youtube', 'caption': 'bad'}
+    ]
+    response = client.post('/api/posts', json=payload)
+
+    assert response.status_code == 400
+    assert response.get_json()['error'].startswith('Post 1:')
+    assert client.get('/api/posts').get_json() == []
+
+
+def test_n_plus_one_canary_counts_only_reads(app):
+    with app.test_request_context('/api/posts', method='POST'):
+        app.preprocess_request()
+        for i in range(5):
+            db.session.execute(insert(ScheduledPost).values(
+                platform='tiktok', caption=str(i), scheduled_datetime=datetime(2026, 1, 1, 10)
+            ))
+        assert g.query_count == 0
+
+        db.session.execute(select(ScheduledPost.id)).all()
+        assert g.query_count == 1
+        db.session.rollback()
+
+
+def test_n_plus_one_canary_resets_between_requests(client, caplog):
+    create_post(client)
+    with caplog.at_level('WARNING'):
+        for _ in range(5):
+            assert client.get('/api/posts').status_code == 200
+
+    assert 'Possible N+1' not in caplog.text
+
+
+def test_write_succeeds_when_cache_is_down(client, monkeypatch):
+    def broken(*args, **kwargs):
+        raise ConnectionError('cache unavailable')
+
+    monkeypatch.setattr(cache, 'delete', broken)
+    post = create_post(client)
+
+    assert client.put(f"/api/posts/{post['id']}", json={'caption': 'edited'}).status_code == 200
+    assert client.delete(f"/api/posts/{post['id']}").status_code == 200
+
+
+def test_bulk_create_rejects_oversized_batch(client):
+    payload = [
+        {'platform': 'tiktok', 'caption': str(i), 'scheduled_datetime': '2026-01-01T10:00'}
+        for i in range(MAX_BULK_POSTS + 1)
+    ]
+    response = client.post('/api/posts', json=payload)
+
+    assert response.status_code == 400
+    assert client.get('/api/posts').get_json() == []
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2026-01-02T10:00', datetime(2026, 1, 2, 10, 0)),
+    ('2026-01-02T10:00:30', datetime(2026, 1, 2, 10, 0, 30)),
+])
+def test_parse_sched_accepts_form_format(value, expected):
+    assert parse_sched(value) == expected
+
+
+@pytest.mark.parametrize('value', [
+    '2026-01-02T10:00\n',
+    '２０２６-01-02T10:00',
+    '2026-01-02 10:00',
+    '2026-01-02',
+    '2026-01-02T10:00:00.123',
+    '2026-01-02T10:00+00:00',
+    '2026-13-02T10:00',
+    '',
+    None,
+    20260102,
+])
+def test_parse_sched_rejects_other_formats(value):
+    with pytest.raises(ValueError):
+        parse_sched(value)
+
+
+def test_create_post_rejects_invalid_datetime(client):
+    response = client.post('/api/posts', json={
+        'platform': 'tiktok', 'caption': 'hello', 'scheduled_datetime': '2026-01-02T10:00\n'
+    })
+
+    assert response.status_code == 400
+    assert client.get('/api/posts').get_json() == []
+
+
+@pytest.mark.parametrize('dialect, expected', [
+    (postgresql.dialect(), "TIMEZONE('utc', CURRENT_TIMESTAMP)"),
+    (mssql.dialect(), 'GETUTCDATE()'),
+    (mysql.dialect(), 'UTC_TIMESTAMP(6)'),
+    (sqlite.dialect(), "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"),
+])
+def test_utcnow_compiles_to_utc_per_dialect(dialect, expected):
+    assert str(utcnow().compile(dialect=dialect)) == expected
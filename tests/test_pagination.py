@@ -0,0 +1,76 @@
+from app import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+
+def create_posts(client, *datetimes):
+    payload = [
+        {'platform': 'tiktok', 'caption': str(i), 'scheduled_datetime': when}
+        for i, when in enumerate(datetimes)
+    ]
+    response = client.post('/api/posts', json=payload)
+    assert response.status_code == 201
+    return [post['id'] for post in response.get_json()]
+
+
+def ids(response):
+    assert response.status_code == 200
+    return [post['id'] for post in response.get_json()]
+
+
+def test_limit_is_rebound_on_every_request(client):
+    create_posts(client, *[f'2026-01-0{day}T10:00' for day in range(1, 6)])
+
+    # Same lambda_stmt code path, different closure values
+    assert len(ids(client.get('/api/posts?limit=2'))) == 2
+    assert len(ids(client.get('/api/posts?limit=3'))) == 3
+
+
+def test_limit_is_clamped(client):
+    for _ in range(2):
+        create_posts(client, *['2026-01-01T10:00'] * 150)
+
+    assert len(ids(client.get('/api/posts?limit=0'))) == 1
+    assert len(ids(client.get('/api/posts?limit=-5'))) == 1
+    assert len(ids(client.get('/api/posts?limit=1000'))) == MAX_PAGE_SIZE
+    assert len(ids(client.get('/api/posts?limit=abc'))) == DEFAULT_PAGE_SIZE
+
+
+def test_next_cursor_headers_only_on_full_page(client):
+    _, second, _ = create_posts(client, '2026-01-01T10:00', '2026-01-02T10:00', '2026-01-03T10:00')
+
+    response = client.get('/api/posts?limit=2')
+    assert response.headers['X-Next-Cursor'] == '2026-01-02T10:00:00'
+    assert response.headers['X-Next-Cursor-Id'] == str(second)
+
+    response = client.get('/api/posts?limit=5')
+    assert 'X-Next-Cursor' not in response.headers
+
+
+def test_cursor_without_id_skips_tied_timestamps(client):
+    tied = create_posts(client, '2026-01-01T10:00', '2026-01-01T10:00', '2026-01-01T10:00')
+    later = create_posts(client, '2026-01-02T10:00')
+
+    assert ids(client.get('/api/posts?cursor=2026-01-01T10:00')) == later
+    assert ids(client.get('/api/posts?cursor=2026-01-01T09:00')) == tied + later
+
+
+def test_cursor_with_id_walks_tied_timestamps(client):
+    tied = create_posts(client, '2026-01-01T10:00', '2026-01-01T10:00', '2026-01-01T10:00')
+    later = create_posts(client, '2026-01-02T10:00')
+
+    seen = []
+    url = '/api/posts?limit=1'
+    while url:
+        response = client.get(url)
+        seen += ids(response)
+        cursor = response.headers.get('X-Next-Cursor')
+        url = cursor and f"/api/posts?limit=1&cursor={cursor}&cursor_id={response.headers['X-Next-Cursor-Id']}"
+
+    assert seen == tied + later
+    assert ids(client.get(f'/api/posts?cursor=2026-01-01T10:00&cursor_id={tied[0]}')) == tied[1:] + later
+
+
+def test_bad_cursor_is_rejected(client):
+    response = client.get('/api/posts?cursor=not-a-date')
+
+    assert response.status_code == 400
+    assert 'Invalid cursor' in response.get_json()['error']